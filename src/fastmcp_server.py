@@ -2,59 +2,200 @@
 
 import os
 import sys
+import asyncio
 import aiohttp
+import orjson
 import structlog
+import structlog.tracebacks
 import logging
-from typing import Dict, Any, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Final, List, Optional, Set, Tuple
 from datetime import datetime
 from fastmcp import FastMCP, Context
+from yarl import URL
 
 from .utils.config import get_settings, validate_api_keys
+from .utils.http import close_session, get_session
 from .utils.errors import APIError, ErrorCode
 
 
-# Configure structlog to output to stderr
+# Get settings and validate API keys at module level
+settings = get_settings()
+available_apis = validate_api_keys()
+
+# Unrecognised LOG_LEVEL values fall back to INFO rather than failing import
+_LOG_LEVEL = logging.getLevelNamesMapping().get(settings.log_level.upper(), logging.INFO)
+
+# Configure structlog to output JSON lines to stderr - native filtering bound
+# logger, no stdlib logging machinery on the hot path, orjson writes bytes
 structlog.configure(
     processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.dev.ConsoleRenderer()
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        # Structured tracebacks without frame locals - locals include API keys
+        structlog.processors.ExceptionRenderer(
+            structlog.tracebacks.ExceptionDictTransformer(show_locals=False)
+        ),
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
     ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.WriteLoggerFactory(file=sys.stderr),
+    wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL),
+    logger_factory=structlog.BytesLoggerFactory(file=sys.stderr.buffer),
     cache_logger_on_first_use=True,
 )
 
-# Configure logging
-logger = structlog.get_logger(__name__)
+# Configure logging - bind eagerly so the first tool call doesn't pay for
+# materializing the cached logger behind the lazy proxy
+logger = structlog.get_logger(__name__).bind()
+
+# Response cache - formatted tool output keyed on (cache kind, request params)
+_CACHE_TTLS = {
+    "weather": 600,
+    "news_top": 300,
+    "news_search": 120,
+    "stock_quote": 30,
+    "stock_search": 86400,
+}
+_CACHE_MAX_ENTRIES = 1024
+# Fraction of the TTL after which a cache hit also re-fetches the entry in the
+# background, so entries that keep getting hit never expire into a miss
+_CACHE_REFRESH_AHEAD = 0.8
+_cache: "OrderedDict[Tuple, Tuple[float, str]]" = OrderedDict()
+
+
+def _cache_key(kind: str, params: Dict[str, Any]) -> Tuple:
+    """Build a hashable cache key from a cache kind and request params."""
+    return (kind, tuple(sorted(params.items())))
+
+
+def _cache_get(key: Tuple) -> Optional[Tuple[str, bool]]:
+    """Return a cached response if it is still fresh, and whether it is due for refresh."""
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    age = time.monotonic() - stored_at
+    ttl = _CACHE_TTLS[key[0]]
+    if age >= ttl:
+        del _cache[key]
+        return None
+    _cache.move_to_end(key)
+    return value, age >= ttl * _CACHE_REFRESH_AHEAD
+
+
+def _cache_set(key: Tuple, value: str) -> str:
+    """Store a successful response in the cache, evicting the oldest entries."""
+    if not value.startswith("❌"):
+        _cache[key] = (time.monotonic(), value)
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return value
+
+
+# In-flight upstream fetches - concurrent identical queries share one request
+_inflight: "Dict[Tuple, asyncio.Task[str]]" = {}
+# Keys of in-flight background refreshes that no caller is awaiting
+_unawaited: Set[Tuple] = set()
+
+
+def _start_fetch(
+    key: Tuple,
+    fetch: Callable[[], Awaitable[str]],
+    background: bool = False,
+) -> "asyncio.Task[str]":
+    """Start fetch as a shared in-flight task that caches its result."""
+    async def fetch_and_store() -> str:
+        return _cache_set(key, await fetch())
+    
+    def on_done(task: "asyncio.Task[str]") -> None:
+        _inflight.pop(key, None)
+        unawaited = key in _unawaited
+        _unawaited.discard(key)
+        if task.cancelled():
+            return
+        # Always retrieve the exception; awaiting callers get it raised, so
+        # only log failures of background refreshes nobody is waiting on
+        error = task.exception()
+        if error is not None and unawaited:
+            logger.error(
+                "Background refresh failed",
+                cache_kind=key[0],
+                exc_type=type(error).__name__,
+                error=repr(error),
+            )
+    
+    task = asyncio.ensure_future(fetch_and_store())
+    _inflight[key] = task
+    if background:
+        _unawaited.add(key)
+    task.add_done_callback(on_done)
+    return task
+
+
+async def _cached_fetch(key: Tuple, fetch: Callable[[], Awaitable[str]]) -> str:
+    """Return a cached response, or run fetch once per key and cache its result.
+    
+    Callers that arrive while a fetch for the same key is running await that
+    fetch instead of issuing their own upstream request. Hits on entries near
+    expiry are served from the cache while a background fetch refreshes them.
+    """
+    cached = _cache_get(key)
+    if cached is not None:
+        value, needs_refresh = cached
+        if needs_refresh and key not in _inflight:
+            _start_fetch(key, fetch, background=True)
+        return value
+    
+    task = _inflight.get(key)
+    if task is None:
+        task = _start_fetch(key, fetch)
+    else:
+        # Joining a background refresh - this caller now receives its errors
+        _unawaited.discard(key)
+    
+    # Shield so one caller being cancelled doesn't cancel the shared fetch
+    return await asyncio.shield(task)
+
 
 # Initialize FastMCP server
 mcp = FastMCP("API Aggregator")
 
-# Get settings and validate API keys at module level
-settings = get_settings()
-available_apis = validate_api_keys()
-
 logger.info("API key validation", available_apis=available_apis)
 
+# Upstream endpoints - parsed once so aiohttp doesn't re-parse the URL per request
+_WEATHER_URL: Final = URL("https://api.openweathermap.org/data/2.5/weather")
+_NEWS_URLS: Final = {
+    "everything": URL("https://newsapi.org/v2/everything"),
+    "top-headlines": URL("https://newsapi.org/v2/top-headlines"),
+}
+_ALPHA_VANTAGE_URL: Final = URL("https://www.alphavantage.co/query")
 
-@mcp.tool
-async def get_weather(
+# Constant lookup tables used by validation and formatting
+_TEMP_UNITS: Final = {"metric": "°C", "imperial": "°F", "kelvin": "K"}
+_SPEED_UNITS: Final = {"metric": "m/s", "imperial": "mph", "kelvin": "m/s"}
+_WEATHER_UNITS: Final = frozenset(_TEMP_UNITS)
+_INVALID_UNITS_MESSAGE: Final = (
+    f"❌ Error: Units must be one of: {', '.join(_TEMP_UNITS)}"
+)
+
+_NEWS_CATEGORIES_ORDERED: Final = (
+    "business", "entertainment", "general", "health",
+    "science", "sports", "technology",
+)
+_NEWS_CATEGORIES: Final = frozenset(_NEWS_CATEGORIES_ORDERED)
+_INVALID_CATEGORY_MESSAGE: Final = (
+    f"❌ Error: Category must be one of: {', '.join(_NEWS_CATEGORIES_ORDERED)}"
+)
+
+
+async def _get_weather(
     city: str,
     country: Optional[str] = None,
     units: str = "metric",
     ctx: Context = None,
 ) -> str:
-    """
-    Get current weather information for a specified city.
-    
-    Args:
-        city: City name (required)
-        country: Country code (optional, improves accuracy) 
-        units: Temperature units - metric, imperial, or kelvin (default: metric)
-    
-    Returns:
-        Current weather information as formatted text
-    """
+    """Get current weather for a city as formatted text."""
     if not available_apis["weather"]:
         return "❌ Weather tool unavailable: Missing OpenWeatherMap API key"
     
@@ -62,14 +203,14 @@ async def get_weather(
         await ctx.info(f"Fetching weather for {city}...")
     
     # Validate inputs
-    if not city or not city.strip():
+    location = (city or "").strip()
+    if not location:
         return "❌ Error: City name cannot be empty"
     
-    if units not in ["metric", "imperial", "kelvin"]:
-        return "❌ Error: Units must be one of: metric, imperial, kelvin"
+    if units not in _WEATHER_UNITS:
+        return _INVALID_UNITS_MESSAGE
     
     # Build location query
-    location = city.strip()
     if country:
         location = f"{location},{country.strip()}"
     
@@ -80,47 +221,41 @@ async def get_weather(
         "units": units,
     }
     
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://api.openweathermap.org/data/2.5/weather",
-                params=params,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return _format_weather_response(data, units)
-                elif response.status == 401:
-                    return "❌ Error: Invalid OpenWeatherMap API key"
-                elif response.status == 404:
-                    return f"❌ Error: City '{location}' not found"
-                else:
-                    return f"❌ Error: OpenWeatherMap API error (status: {response.status})"
-                    
-    except Exception as e:
-        logger.error("Weather API error", error=str(e))
-        return f"❌ Error fetching weather data: {str(e)}"
+    return await _cached_fetch(
+        _cache_key("weather", params),
+        lambda: _fetch_weather(params, location, units),
+    )
 
 
 @mcp.tool
-async def get_news(
-    query: Optional[str] = None,
-    category: Optional[str] = None,
+async def get_weather(
+    city: str,
     country: Optional[str] = None,
-    page_size: int = 5,
+    units: str = "metric",
     ctx: Context = None,
 ) -> str:
     """
-    Get latest news headlines by topic, category, or country.
+    Get current weather information for a specified city.
     
     Args:
-        query: Search query for specific topics (optional)
-        category: News category - business, entertainment, general, health, science, sports, technology (optional)
-        country: Country code for country-specific news like 'us', 'gb', 'ca' (optional)
-        page_size: Number of articles to return, 1-20 (default: 5)
+        city: City name (required)
+        country: Country code (optional, improves accuracy) 
+        units: Temperature units - metric, imperial, or kelvin (default: metric)
     
     Returns:
-        Latest news headlines as formatted text
+        Current weather information as formatted text
     """
+    return await _get_weather(city, country, units, ctx)
+
+
+async def _get_news(
+    query: Optional[str] = None,
+    category: Optional[str] = None,
+    country: Optional[str] = None,
+    page_size: int = 5,
+    ctx: Context = None,
+) -> str:
+    """Get news headlines as formatted text."""
     if not available_apis["news"]:
         return "❌ News tool unavailable: Missing News API key"
     
@@ -131,12 +266,8 @@ async def get_news(
     if page_size < 1 or page_size > 20:
         return "❌ Error: Page size must be between 1 and 20"
     
-    valid_categories = [
-        "business", "entertainment", "general", "health", 
-        "science", "sports", "technology"
-    ]
-    if category and category not in valid_categories:
-        return f"❌ Error: Category must be one of: {', '.join(valid_categories)}"
+    if category and category not in _NEWS_CATEGORIES:
+        return _INVALID_CATEGORY_MESSAGE
     
     # Choose endpoint and build parameters
     if query:
@@ -159,38 +290,37 @@ async def get_news(
     
     params["apiKey"] = settings.news_api_key
     
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://newsapi.org/v2/{endpoint}",
-                params=params,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return _format_news_response(data, query, category, country)
-                elif response.status == 401:
-                    return "❌ Error: Invalid News API key"
-                elif response.status == 429:
-                    return "❌ Error: News API rate limit exceeded"
-                else:
-                    return f"❌ Error: News API error (status: {response.status})"
-                    
-    except Exception as e:
-        logger.error("News API error", error=str(e))
-        return f"❌ Error fetching news data: {str(e)}"
+    return await _cached_fetch(
+        _cache_key("news_search" if query else "news_top", params),
+        lambda: _fetch_news(endpoint, params, query, category, country),
+    )
 
 
 @mcp.tool
-async def get_stock_price(symbol: str, ctx: Context = None) -> str:
+async def get_news(
+    query: Optional[str] = None,
+    category: Optional[str] = None,
+    country: Optional[str] = None,
+    page_size: int = 5,
+    ctx: Context = None,
+) -> str:
     """
-    Get current stock price and trading information for a given symbol.
+    Get latest news headlines by topic, category, or country.
     
     Args:
-        symbol: Stock symbol (e.g., AAPL, MSFT, GOOGL)
+        query: Search query for specific topics (optional)
+        category: News category - business, entertainment, general, health, science, sports, technology (optional)
+        country: Country code for country-specific news like 'us', 'gb', 'ca' (optional)
+        page_size: Number of articles to return, 1-20 (default: 5)
     
     Returns:
-        Current stock price and trading information as formatted text
+        Latest news headlines as formatted text
     """
+    return await _get_news(query, category, country, page_size, ctx)
+
+
+async def _get_stock_price(symbol: str, ctx: Context = None) -> str:
+    """Get a stock quote as formatted text."""
     if not available_apis["stock"]:
         return "❌ Stock tools unavailable: Missing Alpha Vantage API key"
     
@@ -198,10 +328,11 @@ async def get_stock_price(symbol: str, ctx: Context = None) -> str:
         await ctx.info(f"Fetching stock data for {symbol}...")
     
     # Validate input
-    if not symbol or not symbol.strip():
+    symbol = (symbol or "").strip()
+    if not symbol:
         return "❌ Error: Stock symbol cannot be empty"
     
-    symbol = symbol.strip().upper()
+    symbol = symbol.upper()
     
     # Prepare API request
     params = {
@@ -210,34 +341,28 @@ async def get_stock_price(symbol: str, ctx: Context = None) -> str:
         "apikey": settings.alpha_vantage_api_key,
     }
     
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://www.alphavantage.co/query",
-                params=params,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return _format_stock_response(data, symbol)
-                else:
-                    return f"❌ Error: Alpha Vantage API error (status: {response.status})"
-                    
-    except Exception as e:
-        logger.error("Stock API error", error=str(e), symbol=symbol)
-        return f"❌ Error fetching stock data: {str(e)}"
+    return await _cached_fetch(
+        _cache_key("stock_quote", params),
+        lambda: _fetch_stock_price(params, symbol),
+    )
 
 
 @mcp.tool
-async def search_stocks(keywords: str, ctx: Context = None) -> str:
+async def get_stock_price(symbol: str, ctx: Context = None) -> str:
     """
-    Search for stock symbols by company name or keywords.
+    Get current stock price and trading information for a given symbol.
     
     Args:
-        keywords: Search keywords (company name, symbol, etc.)
+        symbol: Stock symbol (e.g., AAPL, MSFT, GOOGL)
     
     Returns:
-        Matching stock symbols and company information as formatted text
+        Current stock price and trading information as formatted text
     """
+    return await _get_stock_price(symbol, ctx)
+
+
+async def _search_stocks(keywords: str, ctx: Context = None) -> str:
+    """Search stock symbols and return formatted text."""
     if not available_apis["stock"]:
         return "❌ Stock tools unavailable: Missing Alpha Vantage API key"
     
@@ -245,48 +370,242 @@ async def search_stocks(keywords: str, ctx: Context = None) -> str:
         await ctx.info(f"Searching stocks for: {keywords}")
     
     # Validate input
-    if not keywords or not keywords.strip():
+    keywords = (keywords or "").strip()
+    if not keywords:
         return "❌ Error: Search keywords cannot be empty"
     
     params = {
         "function": "SYMBOL_SEARCH",
-        "keywords": keywords.strip(),
+        "keywords": keywords,
         "apikey": settings.alpha_vantage_api_key,
     }
     
+    return await _cached_fetch(
+        _cache_key("stock_search", params),
+        lambda: _fetch_stock_search(params, keywords),
+    )
+
+
+@mcp.tool
+async def search_stocks(keywords: str, ctx: Context = None) -> str:
+    """
+    Search for stock symbols by company name or keywords.
+    
+    Args:
+        keywords: Search keywords (company name, symbol, etc.)
+    
+    Returns:
+        Matching stock symbols and company information as formatted text
+    """
+    return await _search_stocks(keywords, ctx)
+
+
+@mcp.tool
+async def get_dashboard(
+    weather_cities: Optional[List[str]] = None,
+    stock_symbols: Optional[List[str]] = None,
+    news_query: Optional[str] = None,
+    ctx: Context = None,
+) -> str:
+    """
+    Get weather, stock quotes and news in one call, fetched concurrently.
+    
+    Args:
+        weather_cities: City names to get current weather for (optional)
+        stock_symbols: Stock symbols to get quotes for (optional)
+        news_query: Search query for latest news (optional)
+    
+    Returns:
+        Combined weather, stock and news information as formatted text
+    """
+    items = [(f"weather for '{city}'", _get_weather(city)) for city in weather_cities or []]
+    items += [(f"stock price for '{symbol}'", _get_stock_price(symbol)) for symbol in stock_symbols or []]
+    if news_query:
+        items.append((f"news for '{news_query}'", _get_news(query=news_query)))
+    
+    if not items:
+        return "❌ Error: Provide at least one of weather_cities, stock_symbols or news_query"
+    
+    if ctx:
+        await ctx.info(f"Fetching {len(items)} dashboard items...")
+    
+    results = await asyncio.gather(*(coro for _, coro in items), return_exceptions=True)
+    
+    sections = []
+    for (label, _), result in zip(items, results):
+        if isinstance(result, BaseException):
+            sections.append(f"❌ Error fetching {label}: {type(result).__name__}: {result}")
+        else:
+            sections.append(result)
+    
+    return "\n\n---\n\n".join(sections)
+
+
+async def _fetch_weather(params: Dict[str, Any], location: str, units: str) -> str:
+    """Fetch and format current weather from OpenWeatherMap."""
+    try:
+        session = await get_session()
+        async with session.get(
+            _WEATHER_URL,
+            params=params,
+        ) as response:
+            # Always drain the body - an unread body forces aiohttp to close
+            # the socket instead of returning it to the keep-alive pool
+            body = await response.read()
+            if response.status == 200:
+                data = orjson.loads(body)
+                return _format_weather_response(data, units)
+            elif response.status == 401:
+                return "❌ Error: Invalid OpenWeatherMap API key"
+            elif response.status == 404:
+                return f"❌ Error: City '{location}' not found"
+            else:
+                return f"❌ Error: OpenWeatherMap API error (status: {response.status})"
+                
+    except asyncio.TimeoutError:
+        logger.error("Weather API timeout")
+        return "❌ Error fetching weather data: upstream timeout"
+    except aiohttp.ClientError as e:
+        logger.error("Weather API error", error=str(e))
+        return f"❌ Error fetching weather data: {e.__class__.__name__}"
+    except orjson.JSONDecodeError as e:
+        logger.error("Weather API returned invalid JSON", error=str(e))
+        return "❌ Error fetching weather data: invalid response from upstream API"
+
+
+async def _fetch_news(
+    endpoint: str,
+    params: Dict[str, Any],
+    query: Optional[str],
+    category: Optional[str],
+    country: Optional[str],
+) -> str:
+    """Fetch and format news from News API."""
+    try:
+        session = await get_session()
+        async with session.get(
+            _NEWS_URLS[endpoint],
+            params=params,
+        ) as response:
+            # Always drain the body - an unread body forces aiohttp to close
+            # the socket instead of returning it to the keep-alive pool
+            body = await response.read()
+            if response.status == 200:
+                data = orjson.loads(body)
+                return _format_news_response(data, query, category, country)
+            elif response.status == 401:
+                return "❌ Error: Invalid News API key"
+            elif response.status == 429:
+                return "❌ Error: News API rate limit exceeded"
+            else:
+                return f"❌ Error: News API error (status: {response.status})"
+                
+    except asyncio.TimeoutError:
+        logger.error("News API timeout")
+        return "❌ Error fetching news data: upstream timeout"
+    except aiohttp.ClientError as e:
+        logger.error("News API error", error=str(e))
+        return f"❌ Error fetching news data: {e.__class__.__name__}"
+    except orjson.JSONDecodeError as e:
+        logger.error("News API returned invalid JSON", error=str(e))
+        return "❌ Error fetching news data: invalid response from upstream API"
+
+
+async def _fetch_stock_price(params: Dict[str, Any], symbol: str) -> str:
+    """Fetch and format a stock quote from Alpha Vantage."""
+    try:
+        session = await get_session()
+        async with session.get(
+            _ALPHA_VANTAGE_URL,
+            params=params,
+        ) as response:
+            # Always drain the body - an unread body forces aiohttp to close
+            # the socket instead of returning it to the keep-alive pool
+            body = await response.read()
+            if response.status == 200:
+                data = orjson.loads(body)
+                return _format_stock_response(data, symbol)
+            else:
+                return f"❌ Error: Alpha Vantage API error (status: {response.status})"
+                
+    except asyncio.TimeoutError:
+        logger.error("Stock API timeout", symbol=symbol)
+        return "❌ Error fetching stock data: upstream timeout"
+    except aiohttp.ClientError as e:
+        logger.error("Stock API error", error=str(e), symbol=symbol)
+        return f"❌ Error fetching stock data: {e.__class__.__name__}"
+    except orjson.JSONDecodeError as e:
+        logger.error("Stock API returned invalid JSON", error=str(e), symbol=symbol)
+        return "❌ Error fetching stock data: invalid response from upstream API"
+
+
+async def _fetch_stock_search(params: Dict[str, Any], keywords: str) -> str:
+    """Fetch and format stock symbol search results from Alpha Vantage."""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                "https://www.alphavantage.co/query",
-                params=params,
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return _format_search_response(data, keywords)
-                else:
-                    return f"❌ Error: Alpha Vantage API error (status: {response.status})"
-                    
-    except Exception as e:
+        session = await get_session()
+        async with session.get(
+            _ALPHA_VANTAGE_URL,
+            params=params,
+        ) as response:
+            # Always drain the body - an unread body forces aiohttp to close
+            # the socket instead of returning it to the keep-alive pool
+            body = await response.read()
+            if response.status == 200:
+                data = orjson.loads(body)
+                return _format_search_response(data, keywords)
+            else:
+                return f"❌ Error: Alpha Vantage API error (status: {response.status})"
+                
+    except asyncio.TimeoutError:
+        logger.error("Stock search API timeout", keywords=keywords)
+        return "❌ Error searching stocks: upstream timeout"
+    except aiohttp.ClientError as e:
         logger.error("Stock search API error", error=str(e), keywords=keywords)
-        return f"❌ Error searching stocks: {str(e)}"
+        return f"❌ Error searching stocks: {e.__class__.__name__}"
+    except orjson.JSONDecodeError as e:
+        logger.error("Stock search API returned invalid JSON", error=str(e), keywords=keywords)
+        return "❌ Error searching stocks: invalid response from upstream API"
+
+
+# datetime.fromisoformat accepts a trailing "Z" natively from Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _parse_iso_utc(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp that may use a trailing "Z" for UTC."""
+    if not _FROMISOFORMAT_ACCEPTS_Z:
+        value = value.replace("Z", "+00:00")
+    return datetime.fromisoformat(value)
+
+
+def _format_published_at(published_at: Any) -> Any:
+    """Format an article timestamp as 'YYYY-MM-DD HH:MM UTC'."""
+    # NewsAPI can send "publishedAt": null - render non-strings unchanged
+    if not isinstance(published_at, str):
+        return published_at
+    # Fast path for NewsAPI's canonical 'YYYY-MM-DDTHH:MM:SSZ' - slice, don't parse
+    if len(published_at) >= 17 and published_at[10] == "T" and published_at.endswith("Z"):
+        return f"{published_at[:10]} {published_at[11:16]} UTC"
+    try:
+        return _parse_iso_utc(published_at).strftime("%Y-%m-%d %H:%M UTC")
+    except ValueError:
+        return published_at
 
 
 def _format_weather_response(data: Dict[str, Any], units: str) -> str:
     """Format weather API response into readable text."""
     # Unit symbols
-    temp_unit = {
-        "metric": "°C",
-        "imperial": "°F", 
-        "kelvin": "K",
-    }[units]
+    temp_unit = _TEMP_UNITS[units]
+    speed_unit = _SPEED_UNITS[units]
     
-    speed_unit = "m/s" if units == "metric" else "mph" if units == "imperial" else "m/s"
+    main = data['main']
     
     location = f"{data['name']}, {data['sys']['country']}"
     condition = data['weather'][0]['description'].title()
-    temp = data['main']['temp']
-    feels_like = data['main']['feels_like']
-    humidity = data['main']['humidity']
+    temp = main['temp']
+    feels_like = main['feels_like']
+    humidity = main['humidity']
+    pressure = main['pressure']
     wind_speed = data['wind']['speed']
     
     return f"""🌤️ Weather for {location}
@@ -295,7 +614,7 @@ def _format_weather_response(data: Dict[str, Any], units: str) -> str:
 🌡️ Temperature: {temp}{temp_unit} (feels like {feels_like}{temp_unit})
 💧 Humidity: {humidity}%
 💨 Wind Speed: {wind_speed} {speed_unit}
-📊 Pressure: {data['main']['pressure']} hPa
+📊 Pressure: {pressure} hPa
 ☁️ Cloudiness: {data['clouds']['all']}%
 
 Data from OpenWeatherMap"""
@@ -317,8 +636,10 @@ def _format_news_response(data: Dict[str, Any], query: Optional[str], category:
     
     query_info = " | ".join(query_parts) if query_parts else "Top Headlines"
     
-    result = f"📰 Latest News ({query_info})\n"
-    result += f"Found {total_results} articles, showing {len(articles)}:\n\n"
+    parts: list[str] = [
+        f"📰 Latest News ({query_info})\n",
+        f"Found {total_results} articles, showing {len(articles)}:\n\n",
+    ]
     
     for i, article in enumerate(articles, 1):
         title = article.get("title", "No title")
@@ -329,20 +650,16 @@ def _format_news_response(data: Dict[str, Any], query: Optional[str], category:
         # Parse publication date
         published_at = article.get("publishedAt", "Unknown time")
         if published_at != "Unknown time":
-            try:
-                dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                published_at = dt.strftime("%Y-%m-%d %H:%M UTC")
-            except:
-                pass
+            published_at = _format_published_at(published_at)
         
-        result += f"{i}. **{title}**\n"
-        result += f"   📰 Source: {source} | 📅 {published_at}\n"
-        result += f"   📝 {description}\n"
+        parts.append(f"{i}. **{title}**\n")
+        parts.append(f"   📰 Source: {source} | 📅 {published_at}\n")
+        parts.append(f"   📝 {description}\n")
         if url:
-            result += f"   🔗 {url}\n"
-        result += "\n"
+            parts.append(f"   🔗 {url}\n")
+        parts.append("\n")
     
-    return result
+    return "".join(parts)
 
 
 def _format_stock_response(data: Dict[str, Any], symbol: str) -> str:
@@ -359,15 +676,17 @@ def _format_stock_response(data: Dict[str, Any], symbol: str) -> str:
         return f"❌ Error: No data available for symbol '{symbol}'"
     
     # Extract quote data
-    current_price = float(quote.get("05. price", 0))
-    previous_close = float(quote.get("08. previous close", 0))
-    change = float(quote.get("09. change", 0))
-    change_percent = quote.get("10. change percent", "0%").replace("%", "")
-    open_price = float(quote.get("02. open", 0))
-    high = float(quote.get("03. high", 0))
-    low = float(quote.get("04. low", 0))
-    volume = int(quote.get("06. volume", 0))
-    trading_day = quote.get("07. latest trading day", "Unknown")
+    get = quote.get
+    current_price = float(get("05. price") or 0)
+    previous_close = float(get("08. previous close") or 0)
+    change = float(get("09. change") or 0)
+    change_percent = get("10. change percent") or "0%"
+    change_percent = float(change_percent[:-1] if change_percent.endswith("%") else change_percent)
+    open_price = float(get("02. open") or 0)
+    high = float(get("03. high") or 0)
+    low = float(get("04. low") or 0)
+    volume = int(get("06. volume") or 0)
+    trading_day = get("07. latest trading day", "Unknown")
     
     # Determine if stock is up or down
     direction = "📈" if change >= 0 else "📉"
@@ -401,7 +720,7 @@ def _format_search_response(data: Dict[str, Any], keywords: str) -> str:
     if not matches:
         return f"❌ No stocks found matching '{keywords}'"
     
-    result = f"🔍 Stock Search Results for '{keywords}':\n\n"
+    parts: list[str] = [f"🔍 Stock Search Results for '{keywords}':\n\n"]
     
     for i, match in enumerate(matches[:10], 1):  # Limit to top 10 results
         symbol = match.get("1. symbol", "N/A")
@@ -410,11 +729,35 @@ def _format_search_response(data: Dict[str, Any], keywords: str) -> str:
         region = match.get("4. region", "N/A")
         currency = match.get("8. currency", "N/A")
         
-        result += f"{i}. **{symbol}** - {name}\n"
-        result += f"   🏢 Type: {type_desc}\n"
-        result += f"   🌍 Region: {region} | 💱 Currency: {currency}\n\n"
+        parts.append(f"{i}. **{symbol}** - {name}\n")
+        parts.append(f"   🏢 Type: {type_desc}\n")
+        parts.append(f"   🌍 Region: {region} | 💱 Currency: {currency}\n\n")
+    
+    return "".join(parts)
+
+
+async def _shutdown() -> None:
+    """Cancel in-flight fetches and close the shared HTTP session."""
+    tasks = list(_inflight.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await close_session()
+
+
+def run_server(transport: str, **transport_kwargs: Any) -> None:
+    """Run the server, closing the shared HTTP session once the server loop ends.
+    
+    The session is kept open across MCP sessions - FastMCP's lifespan is
+    entered per client session, so it is not a process shutdown hook.
+    """
+    async def serve() -> None:
+        try:
+            await mcp.run_async(transport=transport, **transport_kwargs)
+        finally:
+            await _shutdown()
     
-    return result
+    asyncio.run(serve())
 
 
 def get_fastmcp_server() -> FastMCP:
@@ -4,9 +4,9 @@ import argparse
 import asyncio
 import structlog
 import sys
-from .fastmcp_server import get_fastmcp_server
+from .fastmcp_server import run_server
 
-logger = structlog.get_logger(__name__)
+logger = structlog.get_logger(__name__).bind()
 
 
 def main():
@@ -34,20 +34,24 @@ Examples:
     
     args = parser.parse_args()
     
-    # Get the FastMCP server
-    mcp = get_fastmcp_server()
+    # Use uvloop for the stdio frame pump, uvicorn and aiohttp when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
     if args.api:
         # Run as REST API server
         logger.info("🌐 Starting as REST API server", host=args.host, port=args.port)
         print(f"🌐 REST API server starting at http://{args.host}:{args.port}", file=sys.stderr)
         print(f"📚 API docs available at http://{args.host}:{args.port}/docs", file=sys.stderr)
-        mcp.run(transport="http", host=args.host, port=args.port)
+        run_server(transport="http", host=args.host, port=args.port)
     else:
         # Default to MCP mode (stdio) - no print statements to stdout
         logger.info("🤖 Starting as MCP server (stdio mode)")
         # Don't print anything to stdout in MCP mode - only JSON-RPC messages should go there
-        mcp.run(transport="stdio")
+        run_server(transport="stdio")
 
 
 if __name__ == "__main__":
@@ -2,9 +2,9 @@
 
 import argparse
 import structlog
-from .fastmcp_server import get_fastmcp_server
+from .fastmcp_server import run_server
 
-logger = structlog.get_logger(__name__)
+logger = structlog.get_logger(__name__).bind()
 
 
 def main():
@@ -17,21 +17,25 @@ def main():
     
     args = parser.parse_args()
     
-    # Get the FastMCP server
-    mcp = get_fastmcp_server()
+    # Use uvloop for the stdio frame pump, uvicorn and aiohttp when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
     if args.stdio:
         # Run in stdio mode (default for MCP clients)
         logger.info("Starting FastMCP server in stdio mode")
-        mcp.run(transport="stdio")
+        run_server(transport="stdio")
     elif args.http:
         # Run in HTTP mode
         logger.info("Starting FastMCP server in HTTP mode", host=args.host, port=args.port)
-        mcp.run(transport="http", host=args.host, port=args.port)
+        run_server(transport="http", host=args.host, port=args.port)
     else:
         # Default to stdio mode
         logger.info("Starting FastMCP server in stdio mode (default)")
-        mcp.run(transport="stdio")
+        run_server(transport="stdio")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,9 @@
 """Configuration management for the API Aggregator MCP Server."""
 
 import os
+from functools import lru_cache
 from typing import Optional, Literal
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -52,19 +52,15 @@ class Settings(BaseSettings):
     def api_key(self) -> Optional[str]:
         return self.mcp_api_key
     
-    model_config = dict(env_file=".env", case_sensitive=False, extra="ignore")
-
-
-# Global settings instance - will be created when get_settings() is first called
-_settings: Optional[Settings] = None
+    model_config = SettingsConfigDict(
+        env_file=".env", case_sensitive=False, extra="ignore", frozen=True
+    )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the current settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """Get the current settings instance (created on first call)."""
+    return Settings()
 
 
 def validate_api_keys() -> dict[str, bool]:
@@ -1,15 +1,15 @@
 """Error handling utilities for the API Aggregator MCP Server."""
 
 import logging
-from enum import Enum
-from typing import Any, Dict, Optional
-from pydantic import BaseModel
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
 
 
-class ErrorCode(Enum):
+class ErrorCode(IntEnum):
     """Standard JSON-RPC error codes."""
     
     # JSON-RPC standard errors
@@ -27,7 +27,8 @@ class ErrorCode(Enum):
     TOOL_NOT_AVAILABLE = -32005
 
 
-class MCPError(BaseModel):
+@dataclass(slots=True)
+class MCPError:
     """Structured error response for MCP protocol."""
     
     code: int
@@ -50,52 +51,61 @@ class APIError(Exception):
         self.code = code
         self.data = data
         self.original_error = original_error
+        self._original_error_str: Optional[str] = None
     
     def to_mcp_error(self) -> MCPError:
         """Convert to MCP error format."""
-        error_data = self.data or {}
-        if self.original_error:
-            error_data["original_error"] = str(self.original_error)
+        if self.original_error is None:
+            error_data = self.data or None
+        else:
+            if self._original_error_str is None:
+                self._original_error_str = str(self.original_error)
+            # Copy so self.data is never mutated by repeated conversions
+            error_data = dict(self.data) if self.data else {}
+            error_data["original_error"] = self._original_error_str
         
         return MCPError(
-            code=self.code.value,
+            code=self.code,
             message=self.message,
-            data=error_data if error_data else None,
+            data=error_data,
         )
 
 
+# HTTP status codes that map to a dedicated error code and message template
+_STATUS_TO_ERROR: Dict[int, Tuple[ErrorCode, str]] = {
+    401: (ErrorCode.API_KEY_INVALID, "Invalid API key for {api}"),
+    429: (ErrorCode.RATE_LIMIT_EXCEEDED, "Rate limit exceeded for {api}"),
+}
+
+
 def handle_external_api_error(
     error: Exception,
     api_name: str,
     operation: str,
 ) -> APIError:
     """Normalize external API errors into our error format."""
-    logger.error(f"External API error in {api_name}.{operation}: {error}")
+    # Lazy %-style args - the message is only formatted if the record is emitted
+    logger.error("External API error in %s.%s: %s", api_name, operation, error)
+    
+    error_data = {"api": api_name, "operation": operation}
     
     # Common HTTP error handling
-    if hasattr(error, 'response'):
-        response = error.response
-        if hasattr(response, 'status_code'):
-            if response.status_code == 401:
-                return APIError(
-                    message=f"Invalid API key for {api_name}",
-                    code=ErrorCode.API_KEY_INVALID,
-                    data={"api": api_name, "operation": operation},
-                    original_error=error,
-                )
-            elif response.status_code == 429:
-                return APIError(
-                    message=f"Rate limit exceeded for {api_name}",
-                    code=ErrorCode.RATE_LIMIT_EXCEEDED,
-                    data={"api": api_name, "operation": operation},
-                    original_error=error,
-                )
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    mapped = _STATUS_TO_ERROR.get(status)
+    if mapped is not None:
+        code, template = mapped
+        return APIError(
+            message=template.format(api=api_name),
+            code=code,
+            data=error_data,
+            original_error=error,
+        )
     
     # Generic external API error
     return APIError(
         message=f"External API error: {api_name} {operation} failed",
         code=ErrorCode.EXTERNAL_API_ERROR,
-        data={"api": api_name, "operation": operation},
+        data=error_data,
         original_error=error,
     )
 
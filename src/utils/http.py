@@ -0,0 +1,42 @@
+"""Shared HTTP client for the API Aggregator MCP Server."""
+
+import asyncio
+import aiohttp
+from typing import Optional
+
+
+# Upstream request timeout - fail fast rather than let slow upstreams pile up
+_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=7)
+
+# Shared HTTP session - reused across tool calls so connections stay warm
+_session: Optional[aiohttp.ClientSession] = None
+_session_lock = asyncio.Lock()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session, creating it on first use."""
+    global _session
+    if _session is not None and not _session.closed:
+        return _session
+    async with _session_lock:
+        if _session is None or _session.closed:
+            _session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=_TIMEOUT,
+            )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared aiohttp session if it is open."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None